@@ -155,4 +155,7 @@ EMAIL_HOST = 'smtp.gmail.com'
 EMAIL_PORT = 587
 EMAIL_HOST_USER = ''   #email account
 EMAIL_HOST_PASSWORD = ''  #app password gen by gmail 2step,delete spaces
-EMAIL_USE_TLS = True
\ No newline at end of file
+EMAIL_USE_TLS = True
+
+# Celery broker for background tasks (e.g. inquiry notification emails)
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
\ No newline at end of file
@@ -7,6 +7,7 @@ class ContactAdmin(admin.ModelAdmin):
   list_display_links = 'id','name'
   readonly_fields = 'user_id','listing_id'
   search_fields = 'name','email','listing'
+  search_help_text = 'Search by contact name, email or listing title'
   list_per_page = 25
 
 admin.site.register(Contact, ContactAdmin)
\ No newline at end of file
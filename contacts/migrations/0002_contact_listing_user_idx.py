@@ -0,0 +1,17 @@
+# Generated by Django 4.2.19 on 2026-08-27 10:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['listing_id', 'user_id'], name='contact_listing_user_idx'),
+        ),
+    ]
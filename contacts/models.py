@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from datetime import datetime
 # Create your models here.
 class Contact(models.Model):
@@ -10,5 +12,14 @@ class Contact(models.Model):
   message = models.TextField(blank=True)
   contact_date = models.DateTimeField(default=datetime.now,blank=True)
   user_id = models.IntegerField()
+  class Meta:
+    indexes = [
+      models.Index(fields=['listing_id','user_id'], name='contact_listing_user_idx'),
+      # Trigram indexes on UPPER(col), matching the UPPER(...) LIKE UPPER(...)
+      # SQL the admin changelist search generates for these columns
+      GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='contact_name_trgm_idx'),
+      GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='contact_email_trgm_idx'),
+      GinIndex(OpClass(Upper('listing'), name='gin_trgm_ops'), name='contact_listing_trgm_idx'),
+    ]
   def __str__(self):
     return self.name
\ No newline at end of file
@@ -0,0 +1,13 @@
+from celery import shared_task
+from django.core.mail import send_mail
+
+@shared_task
+def send_inquiry_email(listing, realtor_email):
+  """Send the realtor inquiry notification off the request path"""
+  send_mail(
+    'Property Listing Inquiry',
+    'There has been an inquiry for ' + listing + '. Sign in to the admin panel for more info',
+    'django_admin@bcre.com', #admin-sender's email
+    [realtor_email], #to-receiver's email
+    fail_silently=False
+  )
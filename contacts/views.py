@@ -1,7 +1,7 @@
 from django.shortcuts import render,redirect,get_object_or_404
 from django.contrib import messages
 from .models import Contact
-from django.core.mail import send_mail
+from .tasks import send_inquiry_email
 
 # Create your views here.
 def contact(request):
@@ -16,7 +16,7 @@ def contact(request):
     realtor_email = request.POST["realtor_email"]
     if request.user.is_authenticated:
       #user_id = request.user.id
-      has_contacted = Contact.objects.all().filter(listing_id=listing_id,user_id=user_id)
+      has_contacted = Contact.objects.filter(listing_id=listing_id,user_id=user_id).exists()
       if has_contacted:
         #has_contacted.update(email=email,phone=phone,message=message)
         #messages.success(request,"You have already make an inquiry for this listing, updated your inquiry")
@@ -24,14 +24,9 @@ def contact(request):
         return redirect('/listings/'+listing_id)
     contact = Contact(listing=listing,listing_id=listing_id,name=name,email=email,phone=phone,message=message,user_id=user_id)
     contact.save()
-    #* send email to realtor to inform him/her there's an inquiry
-    # send_mail(
-    #   'Property Listing Inquiry',
-    #   'There has been an inquiry for ' + listing + '. Sign in to the admin panel for more info',
-    #   'django_admin@bcre.com', #admin-sender's email
-    #   [realtor_email], #to-receiver's email
-    #   fail_silently=False
-    # )
+    #* queue the realtor notification email; the worker talks to SMTP so the
+    #* request doesn't block on it
+    send_inquiry_email.delay(listing, realtor_email)
     messages.success(request,"Your request has been submitted, we will get back to you soon!")
   return redirect('/listings/'+listing_id)
 
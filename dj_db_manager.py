@@ -1,16 +1,33 @@
 import os
 import csv
-import json
+import io
 import sys
 from typing import Dict, Any, List, Tuple
 import django
-from django.db import connection
+from django.db import connection, transaction
+import ijson
+import orjson
+import psycopg2
+from psycopg2 import sql as pg_sql
+from psycopg2.extras import execute_values
 from django.apps import apps
-from django.db.utils import OperationalError
+from django.db.utils import NotSupportedError, OperationalError
 from contextlib import contextmanager
-from datetime import datetime, date, time
 from decimal import Decimal
 
+# Number of rows sent to the database per batch on the fallback INSERT path
+IMPORT_BATCH_SIZE = 1000
+
+# Number of rows fetched per round-trip on the fallback export path
+EXPORT_FETCH_SIZE = 5000
+
+# Number of JSON rows buffered as CSV before each COPY on the import path
+COPY_BUFFER_ROWS = 10000
+
+# Sentinel COPY reads as NULL; with it set, empty CSV fields load as ''
+# exactly like the old per-row INSERT path did
+COPY_NULL_SENTINEL = '\\N'
+
 # Database configuration
 DB_CONFIG = {
     'ENGINE': 'django.db.backends.postgresql',
@@ -21,16 +38,11 @@ DB_CONFIG = {
     'PORT': '5432',
 }
 
-class CustomJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle datetime, date, time, and Decimal objects"""
-    def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        elif isinstance(obj, time):
-            return obj.isoformat()
-        elif isinstance(obj, Decimal):
-            return float(obj)
-        return super().default(obj)
+def json_default(obj):
+    """Handle Decimal for orjson; datetime/date/time are serialized natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
 def validate_file_type(file_path: str) -> Tuple[bool, str]:
     """Validate if file is CSV or JSON"""
@@ -47,10 +59,12 @@ def get_file_headers(file_path: str) -> Tuple[List[str], str]:
                 return next(reader), "csv"
         else:  # JSON
             with open(file_path, 'r') as file:
-                data = json.load(file)
-                if isinstance(data, list) and len(data) > 0:
-                    return list(data[0].keys()), "json"
-                return [], "json"
+                # Peek at the first object only instead of loading the whole array
+                try:
+                    first_row = next(ijson.items(file, 'item'))
+                except StopIteration:
+                    return [], "json"
+                return list(first_row.keys()), "json"
     except Exception as e:
         return [], f"Error reading file: {str(e)}"
 
@@ -61,8 +75,8 @@ def db_cursor():
     try:
         yield cursor
     finally:
+        # Close only the cursor; Django manages the connection's lifetime
         cursor.close()
-        connection.close()
 
 def check_database_connection() -> tuple[bool, str]:
     """Check if database connection is successful"""
@@ -91,38 +105,163 @@ def check_file_exists(file_path: str) -> bool:
     """Check if file exists"""
     return os.path.exists(file_path)
 
+# Memoized column lists, keyed by table name; only found tables are cached
+_table_columns_cache: Dict[str, Tuple[str, ...]] = {}
+
+def fetch_table_columns(table_name: str) -> Tuple[str, ...]:
+    """Fetch table column names from information_schema, cached per run
+
+    Misses are not cached, so a table created mid-session (e.g. by running
+    migrations in another shell) is picked up on the next attempt.
+    """
+    columns = _table_columns_cache.get(table_name)
+    if columns is None:
+        with db_cursor() as cursor:
+            cursor.execute("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = %s
+                ORDER BY ordinal_position;
+            """, [table_name])
+            columns = tuple(row[0] for row in cursor.fetchall())
+        if columns:
+            _table_columns_cache[table_name] = columns
+    return columns
+
 def check_table_exists(table_name: str) -> bool:
     """Check if table exists in database"""
-    with db_cursor() as cursor:
-        cursor.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_name = %s
-            );
-        """, [table_name])
-        return cursor.fetchone()[0]
+    # A table with no columns doesn't exist; reuses the cached column lookup
+    return bool(fetch_table_columns(table_name))
 
 def get_table_columns(table_name: str, include_id: bool = True) -> List[str]:
     """Get table column names, optionally including id column"""
-    with db_cursor() as cursor:
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = %s
-            ORDER BY ordinal_position;
-        """, [table_name])
-        columns = [row[0] for row in cursor.fetchall()]
-        if not include_id and 'id' in columns:
-            columns.remove('id')
-        return columns
-
-def clean_table(table_name: str):
-    """Delete all records from table and reset primary key sequence"""
-    with db_cursor() as cursor:
-        # Delete all records
-        cursor.execute(f"DELETE FROM {table_name};")
-        # Reset primary key sequence
-        cursor.execute(f"ALTER SEQUENCE {table_name}_id_seq RESTART WITH 1;")
+    columns = list(fetch_table_columns(table_name))
+    if not include_id and 'id' in columns:
+        columns.remove('id')
+    return columns
+
+def clean_table(table_name: str, cursor=None) -> bool:
+    """Remove all records from table and reset the primary key sequence
+
+    Returns True when the table was TRUNCATEd, False when it fell back to
+    DELETE because another table references it. No CASCADE: wiping the
+    referencing tables too would be silent cross-table data loss.
+    """
+    if cursor is None:
+        with db_cursor() as cursor:
+            return clean_table(table_name, cursor)
+    try:
+        # TRUNCATE is O(1) metadata work and resets the sequence in the same
+        # call; the savepoint keeps a refusal from poisoning the import
+        # transaction
+        with transaction.atomic():
+            cursor.execute(pg_sql.SQL("TRUNCATE TABLE {} RESTART IDENTITY;").format(
+                pg_sql.Identifier(table_name)))
+        return True
+    except (NotSupportedError, psycopg2.errors.FeatureNotSupported):
+        # Table is referenced by a foreign key; DELETE respects the
+        # constraint and fails loudly if referencing rows actually exist
+        cursor.execute(pg_sql.SQL("DELETE FROM {};").format(pg_sql.Identifier(table_name)))
+        cursor.execute(pg_sql.SQL("ALTER SEQUENCE {} RESTART WITH 1;").format(
+            pg_sql.Identifier(f"{table_name}_id_seq")))
+        return False
+
+def iter_file_rows(file_path: str, file_type: str):
+    """Yield rows from a CSV or JSON file one at a time as dicts"""
+    if file_type == "csv":
+        with open(file_path, 'r') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield row
+    else:  # JSON
+        with open(file_path, 'r') as file:
+            for row in ijson.items(file, 'item'):
+                yield row
+
+def compile_row_factory(headers: List[str]):
+    """Compile a function mapping a row dict to a value tuple in header order
+
+    The generated function bakes the key lookups in as constants, which is
+    measurably faster in the per-row hot loop than a generic
+    tuple(row[h] for h in headers).
+    """
+    lookups = ', '.join(f'row[{header!r}]' for header in headers)
+    namespace = {}
+    exec(f"def make_row(row): return ({lookups},)", namespace)
+    return namespace['make_row']
+
+def copy_import(cursor, file_path: str, table_name: str, file_type: str, headers: List[str],
+                truncated: bool = True):
+    """Import a file with COPY FROM STDIN (single round-trip instead of one INSERT per row)"""
+    # FREEZE skips post-load vacuum work but is only legal when the table was
+    # truncated in this transaction (clean_table may have used DELETE). The
+    # explicit NULL sentinel keeps empty fields as '' rather than NULL.
+    freeze_option = pg_sql.SQL(", FREEZE true") if truncated else pg_sql.SQL("")
+    copy_query = pg_sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N'{})").format(
+        pg_sql.Identifier(table_name),
+        pg_sql.SQL(', ').join(pg_sql.Identifier(header) for header in headers),
+        freeze_option
+    )
+    if file_type == "csv":
+        with open(file_path, 'r') as file:
+            next(file)  # skip the header line, column order is taken from it
+            cursor.copy_expert(copy_query, file)
+    else:  # JSON
+        # Buffer rows as CSV and COPY them in chunks so memory stays bounded
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        make_row = compile_row_factory(headers)
+        buffered = 0
+        for row in iter_file_rows(file_path, file_type):
+            # Only real None becomes NULL; "" values stay empty strings
+            writer.writerow([COPY_NULL_SENTINEL if value is None else value
+                             for value in make_row(row)])
+            buffered += 1
+            if buffered >= COPY_BUFFER_ROWS:
+                buffer.seek(0)
+                cursor.copy_expert(copy_query, buffer)
+                buffer.seek(0)
+                buffer.truncate(0)
+                buffered = 0
+        if buffered:
+            buffer.seek(0)
+            cursor.copy_expert(copy_query, buffer)
+
+def batched_insert_import(cursor, file_path: str, table_name: str, file_type: str, headers: List[str],
+                          truncated: bool = True):
+    """Fallback import path using batched INSERTs via execute_values
+
+    truncated is accepted for signature parity with copy_import; INSERT
+    doesn't care how the table was cleaned.
+    """
+    # Build the statement once, with quoted identifiers; execute_values needs
+    # a plain string, so render it against the underlying psycopg2 cursor
+    inner_cursor = getattr(cursor, 'cursor', cursor)
+    query = pg_sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+        pg_sql.Identifier(table_name),
+        pg_sql.SQL(', ').join(pg_sql.Identifier(header) for header in headers)
+    ).as_string(inner_cursor)
+    make_row = compile_row_factory(headers)
+    batch = []
+    for row in iter_file_rows(file_path, file_type):
+        batch.append(make_row(row))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            execute_values(cursor, query, batch, page_size=IMPORT_BATCH_SIZE)
+            batch = []
+    if batch:
+        execute_values(cursor, query, batch, page_size=IMPORT_BATCH_SIZE)
+
+def run_import_transaction(importer, file_path: str, table_name: str, file_type: str, headers: List[str]):
+    """Clean the table and run one import attempt inside a single transaction"""
+    with transaction.atomic():
+        cursor = connection.cursor()
+        try:
+            # Skip the synchronous WAL flush for this transaction only
+            cursor.execute("SET LOCAL synchronous_commit = OFF;")
+            truncated = clean_table(table_name, cursor)
+            importer(cursor, file_path, table_name, file_type, headers, truncated)
+        finally:
+            cursor.close()
 
 def import_file_to_db(file_path: str, table_name: str) -> str:
     """Import CSV or JSON data to database table"""
@@ -154,33 +293,105 @@ def import_file_to_db(file_path: str, table_name: str) -> str:
         if set(headers) != set(table_columns):
             return f"Error: File format does not match table structure. Expected columns: {table_columns}, Found: {headers}"
 
-        # Clean existing data
-        clean_table(table_name)
-
-        # Import data
-        with db_cursor() as cursor:
-            if file_type == "csv":
-                with open(file_path, 'r') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        columns = ', '.join(row.keys())
-                        values = ', '.join(['%s'] * len(row))
-                        query = f"INSERT INTO {table_name} ({columns}) VALUES ({values})"
-                        cursor.execute(query, list(row.values()))
-            else:  # JSON
-                with open(file_path, 'r') as file:
-                    data = json.load(file)
-                    for row in data:
-                        columns = ', '.join(row.keys())
-                        values = ', '.join(['%s'] * len(row))
-                        query = f"INSERT INTO {table_name} ({columns}) VALUES ({values})"
-                        cursor.execute(query, list(row.values()))
+        # Clean and import inside one transaction so the work commits (and
+        # fsyncs) once instead of per statement. Fall back to batched INSERTs
+        # only when COPY itself is unavailable (no copy_expert on the cursor,
+        # or no COPY privilege); data errors propagate and fail loudly rather
+        # than silently re-running the whole import on the slow path.
+        try:
+            run_import_transaction(copy_import, file_path, table_name, file_type, headers)
+        except (AttributeError, psycopg2.errors.InsufficientPrivilege):
+            run_import_transaction(batched_insert_import, file_path, table_name, file_type, headers)
 
         return f"Successfully imported {file_path} to {table_name}"
 
     except Exception as e:
         return f"Error during import: {str(e)}"
 
+class JsonArrayWriter:
+    """File-like wrapper that turns COPY row_to_json output (one JSON object
+    per line) into a JSON array on the underlying file"""
+    def __init__(self, file):
+        self.file = file
+        self.first = True
+        self.partial = ''
+        file.write('[')
+
+    def write(self, data):
+        self.partial += data
+        lines = self.partial.split('\n')
+        self.partial = lines.pop()
+        for line in lines:
+            if line:
+                self.file.write('\n' if self.first else ',\n')
+                # COPY text format doubles every backslash on the wire. The
+                # JSON from row_to_json contains no raw control characters
+                # (they are already \-escaped inside the JSON), so undoing the
+                # doubling is the only unescaping needed to restore the
+                # exact JSON text.
+                self.file.write(line.replace('\\\\', '\\'))
+                self.first = False
+
+    def close(self):
+        if self.partial:
+            self.write('\n')
+        self.file.write('\n]' if not self.first else ']')
+
+def copy_export(cursor, table_name: str, file_path: str, table_columns: List[str]):
+    """Export a table with COPY TO STDOUT, writing straight to the output file"""
+    column_sql = pg_sql.SQL(', ').join(pg_sql.Identifier(col) for col in table_columns)
+    if file_path.lower().endswith('.csv'):
+        copy_query = pg_sql.SQL("COPY (SELECT {} FROM {}) TO STDOUT WITH CSV HEADER").format(
+            column_sql, pg_sql.Identifier(table_name))
+        with open(file_path, 'w', newline='') as file:
+            cursor.copy_expert(copy_query, file)
+    else:  # JSON
+        copy_query = pg_sql.SQL(
+            "COPY (SELECT row_to_json(t) FROM (SELECT {} FROM {}) t) TO STDOUT"
+        ).format(column_sql, pg_sql.Identifier(table_name))
+        with open(file_path, 'w') as file:
+            writer = JsonArrayWriter(file)
+            cursor.copy_expert(copy_query, writer)
+            writer.close()
+
+def iter_table_rows(cursor):
+    """Yield rows from a cursor in fetchmany batches"""
+    while True:
+        batch = cursor.fetchmany(EXPORT_FETCH_SIZE)
+        if not batch:
+            break
+        yield batch
+
+def python_export(table_name: str, file_path: str, table_columns: List[str]):
+    """Fallback export path streaming rows through a server-side cursor"""
+    connection.ensure_connection()
+    # Named cursor keeps the result set on the server; withhold is needed
+    # because the Django connection runs in autocommit mode
+    cursor = connection.connection.cursor(name='dj_db_manager_export', withhold=True)
+    try:
+        cursor.execute(f"SELECT {', '.join(table_columns)} FROM {table_name}")
+
+        if file_path.lower().endswith('.csv'):
+            with open(file_path, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(table_columns)  # Write headers in table order
+                for batch in iter_table_rows(cursor):
+                    writer.writerows(batch)
+        else:  # JSON
+            with open(file_path, 'w') as file:
+                file.write('[')
+                first = True
+                for batch in iter_table_rows(cursor):
+                    for row in batch:
+                        file.write('\n' if first else ',\n')
+                        file.write(orjson.dumps(dict(zip(table_columns, row)),
+                                                default=json_default,
+                                                option=orjson.OPT_INDENT_2).decode())
+                        first = False
+                file.write('\n]' if not first else ']')
+    finally:
+        cursor.close()
+
 def export_db_to_file(table_name: str, file_path: str) -> str:
     """Export database table to CSV or JSON"""
     try:
@@ -202,37 +413,13 @@ def export_db_to_file(table_name: str, file_path: str) -> str:
         # Get table columns (including id)
         table_columns = get_table_columns(table_name, include_id=True)
 
-        # Export data
-        with db_cursor() as cursor:
-            cursor.execute(f"SELECT {', '.join(table_columns)} FROM {table_name}")
-            rows = cursor.fetchall()
-
-        if file_path.lower().endswith('.csv'):
-            with open(file_path, 'w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(table_columns)  # Write headers in table order
-                writer.writerows(rows)
-        else:  # JSON
-            data = []
-            for row in rows:
-                # Convert row to dict and handle special types
-                row_dict = {}
-                for i, value in enumerate(row):
-                    if isinstance(value, (datetime, date, time, Decimal)):
-                        if isinstance(value, datetime):
-                            row_dict[table_columns[i]] = value.isoformat()
-                        elif isinstance(value, date):
-                            row_dict[table_columns[i]] = value.isoformat()
-                        elif isinstance(value, time):
-                            row_dict[table_columns[i]] = value.isoformat()
-                        elif isinstance(value, Decimal):
-                            row_dict[table_columns[i]] = float(value)
-                    else:
-                        row_dict[table_columns[i]] = value
-                data.append(row_dict)
-            
-            with open(file_path, 'w') as file:
-                json.dump(data, file, indent=4, cls=CustomJSONEncoder)
+        # Export data, preferring server-side COPY TO STDOUT and falling back
+        # to fetching rows through Python when COPY is unavailable
+        try:
+            with db_cursor() as cursor:
+                copy_export(cursor, table_name, file_path, table_columns)
+        except (AttributeError, psycopg2.Error):
+            python_export(table_name, file_path, table_columns)
 
         return f"Successfully exported {table_name} to {file_path}"
 
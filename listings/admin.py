@@ -8,6 +8,7 @@ class ListingAdmin(admin.ModelAdmin):
   list_display = ('id','title','is_published','price','list_date','realtor')
   list_display_links = 'id','title'
   list_filter = 'realtor',
+  list_select_related = 'realtor',
   list_editable = 'is_published', 'price'
   search_fields = 'title','description','address','price'
   list_per_page = 25
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from datetime import datetime
 from realtors.models import Realtor
 from . choices import district_choices
@@ -27,5 +29,13 @@ class Listing(models.Model):
   photo_5 = models.ImageField(upload_to='photos/%Y/%m/%d/', blank=True)
   photo_6 = models.ImageField(upload_to='photos/%Y/%m/%d/', blank=True)
 
+  class Meta:
+    # Trigram indexes on UPPER(col) to match the UPPER(...) LIKE UPPER(...)
+    # SQL Django generates for icontains, so the searches can use them
+    indexes = [
+      GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='listing_title_trgm_idx'),
+      GinIndex(OpClass(Upper('description'), name='gin_trgm_ops'), name='listing_desc_trgm_idx'),
+    ]
+
   def __str__(self):
     return f"House Title : {self.title}"
\ No newline at end of file
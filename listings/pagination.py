@@ -0,0 +1,16 @@
+from functools import cached_property
+from hashlib import md5
+from django.core.cache import cache
+from django.core.paginator import Paginator
+
+# How long a page count stays cached, in seconds
+COUNT_CACHE_TTL = 30
+
+class CachedCountPaginator(Paginator):
+  """Paginator that caches the COUNT(*) result for a short TTL, keyed on the
+  queryset's SQL, so browsing pages of the same (filtered) listing set does
+  not re-run the count query on every request"""
+  @cached_property
+  def count(self):
+    cache_key = 'paginator_count:' + md5(str(self.object_list.query).encode()).hexdigest()
+    return cache.get_or_set(cache_key, self.object_list.count, COUNT_CACHE_TTL)
@@ -3,15 +3,20 @@ from . models import Listing
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q,F
 from listings.choices import price_choices, bedroom_choices, district_choices
+from .pagination import CachedCountPaginator
 
 # Create your views here.
+# Fields the list/search templates actually render; keeps the JOINed query light
+LIST_FIELDS = ('id','title','district','price','bedrooms','bathrooms','sqft',
+               'clubhouse','list_date','photo_main','realtor__name')
+
 def listings(request):
   #listings = Listing.objects.all()
-  listings = Listing.objects.order_by('-list_date').filter(is_published=True)
+  listings = Listing.objects.select_related('realtor').only(*LIST_FIELDS).order_by('-list_date').filter(is_published=True)
   #listings = Listing.objects.filter(Q(district='Pok Fu Lam') | Q(district='Tai Koo'))
   #listings = Listing.objects.filter(Q(district='Pok Fu Lam') & ~Q(bedrooms='2'))
   #listings = Listing.objects.filter(district=F('address'))
-  paginator = Paginator(listings, 3)
+  paginator = CachedCountPaginator(listings, 3)
   page = request.GET.get('page')
   paged_listings = paginator.get_page(page)
   context = {'listings':paged_listings}
@@ -20,33 +25,33 @@ def listings(request):
   # return render(request, 'listings/listings.html',{'listings':'something'})
 
 def listing(request,listing_id):
-  listing = get_object_or_404(Listing, pk=listing_id)
+  listing = get_object_or_404(Listing.objects.select_related('realtor'), pk=listing_id)
   context = {'listing':listing}
   return render(request, 'listings/listing.html', context)
 
 def search(request):
-  queryset_list = Listing.objects.order_by('-list_date').filter(is_published=True)
-  if 'keywords' in request.GET:
-    keywords = request.GET['keywords']
-    if keywords:
-      queryset_list = queryset_list.filter(description__icontains=keywords)
-  if 'title' in request.GET:
-    title = request.GET['title']
-    if title:
-      queryset_list = queryset_list.filter(title__icontains=title)
-  if 'district' in request.GET:
-    district = request.GET['district']
-    if district:
-      queryset_list = queryset_list.filter(district__iexact=district)
-  if 'bedrooms' in request.GET:
-    bedrooms = request.GET['bedrooms']
-    if bedrooms:
-      queryset_list = queryset_list.filter(bedrooms__gte=bedrooms)
-  if 'price' in request.GET:
-    price = request.GET['price']
-    if price:
-      queryset_list = queryset_list.filter(price__lte=price)
-  paginator = Paginator(queryset_list, 3)
+  queryset_list = Listing.objects.select_related('realtor').only(*LIST_FIELDS).order_by('-list_date').filter(is_published=True)
+  # Collect all populated params into one Q and filter once; an empty Q is
+  # falsy, so a blank form skips the filter entirely
+  filters = Q()
+  keywords = request.GET.get('keywords')
+  if keywords:
+    filters &= Q(description__icontains=keywords)
+  title = request.GET.get('title')
+  if title:
+    filters &= Q(title__icontains=title)
+  district = request.GET.get('district')
+  if district:
+    filters &= Q(district__iexact=district)
+  bedrooms = request.GET.get('bedrooms')
+  if bedrooms:
+    filters &= Q(bedrooms__gte=bedrooms)
+  price = request.GET.get('price')
+  if price:
+    filters &= Q(price__lte=price)
+  if filters:
+    queryset_list = queryset_list.filter(filters)
+  paginator = CachedCountPaginator(queryset_list, 3)
   page = request.GET.get('page')
   paged_listings = paginator.get_page(page)
   values = request.GET.copy()